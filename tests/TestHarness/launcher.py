@@ -1,5 +1,6 @@
 import argparse
 import datetime
+import functools
 from dataclasses import InitVar, dataclass, field, is_dataclass, asdict
 from enum import Enum
 import json
@@ -15,6 +16,7 @@ from .logging import fc_log_level
 from .accounts import createAccountKeys
 
 block_dir = 'blocks'
+_ASCII = string.ascii_lowercase
 
 class EnhancedEncoder(json.JSONEncoder):
     def default(self, o):
@@ -28,6 +30,7 @@ class EnhancedEncoder(json.JSONEncoder):
 
 @dataclass
 class KeyStrings(object):
+    __slots__ = ('pubkey', 'privkey')
     pubkey: str
     privkey: str
 
@@ -56,7 +59,6 @@ class nodeDefinition:
     http_count: ClassVar[int] = 0
     p2p_port_generator = None
     http_port_generator = None
-    _dot_label: str = ''
 
     def __post_init__(self, node_cfg_name, base_dir, cfg_name, data_name):
         self.config_dir_name = Path(base_dir) / cfg_name / node_cfg_name
@@ -94,28 +96,14 @@ class nodeDefinition:
     def p2p_endpoint(self):
         return self.public_name + ':' + str(self.p2p_port)
 
-    @property
+    @functools.cached_property
     def dot_label(self):
-        if not self._dot_label:
-            self._dot_label = self.mk_dot_label()
-        return self._dot_label
-    
-    def mk_dot_label(self):
-        node_name = self.name + '\nprod='
-        if len(self.producers) > 0:
-            node_name += '\n'.join(self.producers)
-        else:
-            node_name += '<none>'
-        return self.mk_host_dot_label() + '\n' + node_name
-
-    def mk_host_dot_label(self):
-        if not self.public_name:
-            host_label = self.p2p_endpoint
-        elif self.public_name == self.host_name:
+        if not self.public_name or self.public_name == self.host_name:
             host_label = self.p2p_endpoint
         else:
-            host_label = self.public_name + '/' + self.host_name
-        return host_label
+            host_label = f'{self.public_name}/{self.host_name}'
+        producers = '\n'.join(self.producers) if self.producers else '<none>'
+        return f'{host_label}\n{self.name}\nprod={producers}'
 
 @dataclass
 class testnetDefinition:
@@ -127,19 +115,107 @@ class testnetDefinition:
         nodeDefinition.p2p_port_generator = None
         nodeDefinition.http_port_generator = None
 
+_DEF_NAMES = tuple(f'defproducer{c}' for c in _ASCII)
+_SHR_NAMES = tuple(f'shrproducer{c}' for c in _ASCII)
+
 def producer_name(producer_number: int, shared_producer: bool = False):
     '''For first 26 return "defproducera" ... "defproducerz".
        After 26 return "defpraaaaaab", "defpraaaaaac"...'''
-    if producer_number > len(string.ascii_lowercase) - 1:
+    if producer_number > len(_ASCII) - 1:
         def alpha_str_base(number: int, base: str):
             '''Convert number to base represented as string of "digits"'''
             d,m = divmod(number, len(base))
             if d > 0:
                 return alpha_str_base(d, base) + base[m]
             return base[m]
-        return ('shr' if shared_producer else 'def') + 'pr' + alpha_str_base(producer_number - len(string.ascii_lowercase) + 1, string.ascii_lowercase).rjust(7, string.ascii_lowercase[0])
+        return ('shr' if shared_producer else 'def') + 'pr' + alpha_str_base(producer_number - len(_ASCII) + 1, _ASCII).rjust(7, _ASCII[0])
     else:
-        return ('shr' if shared_producer else 'def') + 'producer' + string.ascii_lowercase[producer_number]
+        return (_SHR_NAMES if shared_producer else _DEF_NAMES)[producer_number]
+
+def _next_ndx(ndx: int, total_nodes: int, bios_ndx: int):
+    '''Return the index following ndx, skipping bios, and whether the walk wrapped around.'''
+    while True:
+        ndx += 1
+        if ndx == total_nodes:
+            return (1 if bios_ndx == 0 else 0), True
+        if ndx != bios_ndx:
+            return ndx, False
+
+def _skip_ndx(begin: int, offset: int, total_nodes: int, bios_ndx: int):
+    '''Return the index offset from begin, advancing past bios and begin itself.'''
+    ndx = (begin + offset) % total_nodes
+    if total_nodes > 2:
+        attempts = total_nodes - 1
+        while attempts and (ndx == bios_ndx or ndx == begin):
+            ndx, _ = _next_ndx(ndx, total_nodes, bios_ndx)
+            attempts -= 1
+    return ndx
+
+@functools.lru_cache(maxsize=1)
+def _logging_template():
+    with open(Path(__file__).resolve().parents[0] / 'logging-template.json', 'r') as default:
+        return default.read()
+
+_SHAPES = {
+    'ring': 'make_line_ring',
+    'line': 'make_line_line',
+    'star': 'make_star',
+    'mesh': 'make_mesh',
+}
+_BUILTIN_SHAPES = frozenset(_SHAPES)
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    '''Build the launcher argument parser once; it is shared by every cluster_generator.'''
+    def comma_separated(string):
+        return string.split(',')
+    parser = argparse.ArgumentParser(description='launcher command line options',
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('-i', '--timestamp', help='set the timestamp for the first block.  Use "now" to indicate the current time')
+    parser.add_argument('-l', '--launch', choices=['all', 'none', 'local'], help='select a subset of nodes to launch.  If not set, the default is to launch all unless an output file is named, in which case none are started.', default='all')
+    parser.add_argument('-o', '--output', help='save a copy of the generated topology in this file and exit without launching', dest='topology_filename')
+    parser.add_argument('-k', '--kill', help='retrieve the list of previously started process ids and issue a kill to each')
+    parser.add_argument('--down', type=comma_separated, help='comma-separated list of node numbers that will be shut down', default=[])
+    parser.add_argument('--bounce', type=comma_separated, help='comma-separated list of node numbers that will be restarted', default=[])
+    parser.add_argument('--roll', type=comma_separated, help='comma-separated list of host names where the nodes will be rolled to a new version')
+    parser.add_argument('-b', '--base_dir', type=Path, help='base directory where configuration and data files will be written', default=Path('.'))
+    parser.add_argument('--config-dir', type=Path, help='directory containing configuration files such as config.ini', default=Path('etc') / 'eosio')
+    parser.add_argument('--data-dir', type=Path, help='name of subdirectory under base-dir where node data will be written', default=Path('var') / 'lib')
+    parser.add_argument('-c', '--config', type=Path, help='configuration file name relative to config-dir', default='config.ini')
+    parser.add_argument('-v', '--version', action='version', version='%(prog)s 1.0')
+    
+    cfg = parser.add_argument_group(title='optional and config file arguments')
+    cfg.add_argument('-f', '--force', action='store_true', help='force overwrite of existing configuration files and erase blockchain', default=False)
+    cfg.add_argument('-n', '--nodes', dest='total_nodes', type=int, help='total number of nodes to configure and launch', default=1)
+    cfg.add_argument('--unstarted-nodes', type=int, help='total number of nodes to configure, but not launch', default=0)
+    cfg.add_argument('-p', '--pnodes', type=int, help='number of nodes that contain one or more producers', default=1)
+    cfg.add_argument('--producers', type=int, help='total number of non-bios and non-shared producer instances in this network', default=21)
+    cfg.add_argument('--shared-producers', type=int, help='total number of shared producers on each non-bios node', default=0)
+    cfg.add_argument('-m', '--mode', choices=['any', 'producers', 'specified', 'none'], help='connection mode', default='any')
+    cfg.add_argument('-s', '--shape', help='network topology, use "star", "mesh", "ring", "line" or give a filename for custom', default='star')
+    cfg.add_argument('-g', '--genesis', type=Path, help='set the path to genesis.json', default='./genesis.json')
+    cfg.add_argument('--skip-signature', action='store_true', help='do not require transaction signatures', default=False)
+    cfg.add_argument('--' + Utils.EosServerName, help=f'forward {Utils.EosServerName} command line argument(s) to each instance of {Utils.EosServerName}; enclose all arg(s) in quotes')
+    cfg.add_argument('--specific-num', type=int, action='append', dest='specific_nums', default=[], help=f'forward {Utils.EosServerName} command line argument(s) (using "--specific-{Utils.EosServerName}" flag to this specific instance of {Utils.EosServerName}.  This parameter can be entered multiple times and requires a paired "--specific-{Utils.EosServerName}" flag each time it is used.')
+    cfg.add_argument('--specific-' + Utils.EosServerName, action='append', dest=f'specific_{Utils.EosServerName}es', default=[], help=f'forward {Utils.EosServerName} command line argument(s) to its paired specific instance of {Utils.EosServerName} (using "--specific-num"); enclose arg(s) in quotes')
+    cfg.add_argument('--spcfc-inst-num', type=int, action='append', dest='spcfc_inst_nums', default=[], help=f'specify a path to a binary (using "--spcfc-inst-{Utils.EosServerName}" flag) for launching this numbered instance of {Utils.EosServerName}.  This parameter can be entered multiple times and requires a paired "--spcfc-inst-{Utils.EosServerName}" flag each time it is used.')
+    cfg.add_argument('--spcfc-inst-' + Utils.EosServerName, action='append', dest=f'spcfc_inst_{Utils.EosServerName}es', default=[], help=f'path to a binary to launch for the {Utils.EosServerName} instance number specified by the corresponding "--spcfc-inst-num" flag')
+    cfg.add_argument('-d', '--delay', type=int, help='seconds delay before starting each node after the first', default=0)
+    cfg.add_argument('--boot', action='store_true', help='after deploying the nodes, boot the network', default=False)
+    cfg.add_argument('--nogen', action='store_true', help='launch nodes without writing new config files', default=False)
+    cfg.add_argument('--host-map', help='name of file containing mapping specific nodes to hosts, used to enhance the custom shape argument')
+    cfg.add_argument('--servers', help='name of a file containing ip addresses and names of individual servers to deploy as producers or non-producers')
+    cfg.add_argument('--per-host', type=int, help='specifies how many instances will run on a single host.  Use 0 to indicate all on one', default=0)
+    cfg.add_argument('--network-name', help='network name prefix used in GELF logging source', default='testnet_')
+    cfg.add_argument('--enable-gelf-logging', action='store_true', help='enable gelf logging appender in logging configuration file', default=False)
+    cfg.add_argument('--gelf-endpoint', help='hostname:port or ip:port of GELF endpoint', default='128.0.0.1:12201')
+    cfg.add_argument('--template', help='the startup script template', default='testnet.template')
+    cfg.add_argument('--max-block-cpu-usage', type=int, help='the "max-block-cpu-usage" value to use in the genesis.json file', default=None)
+    cfg.add_argument('--max-transaction-cpu-usage', type=int, help='the "max-transaction-cpu-usage" value to use in the genesis.json file', default=None)
+    cfg.add_argument('--logging-level', type=fc_log_level, help='Provide the "level" value to use in the logging.json file')
+    cfg.add_argument('--logging-level-map', type=json.loads, help='JSON string of a logging level dictionary to use in the logging.json file for specific nodes, matching based on node number. Ex: {"bios":"off","00":"info"}')
+    cfg.add_argument('--is-nodeos-v2', action='store_true', help='Toggles old nodeos compatibility', default=False)
+    return parser
 
 class cluster_generator:
     def __init__(self, args):
@@ -150,66 +226,22 @@ class cluster_generator:
       self.launch_time = datetime.datetime.now().strftime('%Y_%m_%d_%H_%M_%S')
 
     def parseArgs(self, args):
-        '''Configure argument parser and use it on the passed in list of strings.
+        '''Use the launcher argument parser on the passed in list of strings.
         
         arguments:
         args -- list of arguments (may be sys.argv[1:] or synthetic list)
         
         returns -- argparse.Namespace object with parsed results
         '''
-        def comma_separated(string):
-            return string.split(',')
-        parser = argparse.ArgumentParser(description='launcher command line options',
-                                         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
-        parser.add_argument('-i', '--timestamp', help='set the timestamp for the first block.  Use "now" to indicate the current time')
-        parser.add_argument('-l', '--launch', choices=['all', 'none', 'local'], help='select a subset of nodes to launch.  If not set, the default is to launch all unless an output file is named, in which case none are started.', default='all')
-        parser.add_argument('-o', '--output', help='save a copy of the generated topology in this file and exit without launching', dest='topology_filename')
-        parser.add_argument('-k', '--kill', help='retrieve the list of previously started process ids and issue a kill to each')
-        parser.add_argument('--down', type=comma_separated, help='comma-separated list of node numbers that will be shut down', default=[])
-        parser.add_argument('--bounce', type=comma_separated, help='comma-separated list of node numbers that will be restarted', default=[])
-        parser.add_argument('--roll', type=comma_separated, help='comma-separated list of host names where the nodes will be rolled to a new version')
-        parser.add_argument('-b', '--base_dir', type=Path, help='base directory where configuration and data files will be written', default=Path('.'))
-        parser.add_argument('--config-dir', type=Path, help='directory containing configuration files such as config.ini', default=Path('etc') / 'eosio')
-        parser.add_argument('--data-dir', type=Path, help='name of subdirectory under base-dir where node data will be written', default=Path('var') / 'lib')
-        parser.add_argument('-c', '--config', type=Path, help='configuration file name relative to config-dir', default='config.ini')
-        parser.add_argument('-v', '--version', action='version', version='%(prog)s 1.0')
-        
-        cfg = parser.add_argument_group(title='optional and config file arguments')
-        cfg.add_argument('-f', '--force', action='store_true', help='force overwrite of existing configuration files and erase blockchain', default=False)
-        cfg.add_argument('-n', '--nodes', dest='total_nodes', type=int, help='total number of nodes to configure and launch', default=1)
-        cfg.add_argument('--unstarted-nodes', type=int, help='total number of nodes to configure, but not launch', default=0)
-        cfg.add_argument('-p', '--pnodes', type=int, help='number of nodes that contain one or more producers', default=1)
-        cfg.add_argument('--producers', type=int, help='total number of non-bios and non-shared producer instances in this network', default=21)
-        cfg.add_argument('--shared-producers', type=int, help='total number of shared producers on each non-bios node', default=0)
-        cfg.add_argument('-m', '--mode', choices=['any', 'producers', 'specified', 'none'], help='connection mode', default='any')
-        cfg.add_argument('-s', '--shape', help='network topology, use "star", "mesh", "ring", "line" or give a filename for custom', default='star')
-        cfg.add_argument('-g', '--genesis', type=Path, help='set the path to genesis.json', default='./genesis.json')
-        cfg.add_argument('--skip-signature', action='store_true', help='do not require transaction signatures', default=False)
-        cfg.add_argument('--' + Utils.EosServerName, help=f'forward {Utils.EosServerName} command line argument(s) to each instance of {Utils.EosServerName}; enclose all arg(s) in quotes')
-        cfg.add_argument('--specific-num', type=int, action='append', dest='specific_nums', default=[], help=f'forward {Utils.EosServerName} command line argument(s) (using "--specific-{Utils.EosServerName}" flag to this specific instance of {Utils.EosServerName}.  This parameter can be entered multiple times and requires a paired "--specific-{Utils.EosServerName}" flag each time it is used.')
-        cfg.add_argument('--specific-' + Utils.EosServerName, action='append', dest=f'specific_{Utils.EosServerName}es', default=[], help=f'forward {Utils.EosServerName} command line argument(s) to its paired specific instance of {Utils.EosServerName} (using "--specific-num"); enclose arg(s) in quotes')
-        cfg.add_argument('--spcfc-inst-num', type=int, action='append', dest='spcfc_inst_nums', default=[], help=f'specify a path to a binary (using "--spcfc-inst-{Utils.EosServerName}" flag) for launching this numbered instance of {Utils.EosServerName}.  This parameter can be entered multiple times and requires a paired "--spcfc-inst-{Utils.EosServerName}" flag each time it is used.')
-        cfg.add_argument('--spcfc-inst-' + Utils.EosServerName, action='append', dest=f'spcfc_inst_{Utils.EosServerName}es', default=[], help=f'path to a binary to launch for the {Utils.EosServerName} instance number specified by the corresponding "--spcfc-inst-num" flag')
-        cfg.add_argument('-d', '--delay', type=int, help='seconds delay before starting each node after the first', default=0)
-        cfg.add_argument('--boot', action='store_true', help='after deploying the nodes, boot the network', default=False)
-        cfg.add_argument('--nogen', action='store_true', help='launch nodes without writing new config files', default=False)
-        cfg.add_argument('--host-map', help='name of file containing mapping specific nodes to hosts, used to enhance the custom shape argument')
-        cfg.add_argument('--servers', help='name of a file containing ip addresses and names of individual servers to deploy as producers or non-producers')
-        cfg.add_argument('--per-host', type=int, help='specifies how many instances will run on a single host.  Use 0 to indicate all on one', default=0)
-        cfg.add_argument('--network-name', help='network name prefix used in GELF logging source', default='testnet_')
-        cfg.add_argument('--enable-gelf-logging', action='store_true', help='enable gelf logging appender in logging configuration file', default=False)
-        cfg.add_argument('--gelf-endpoint', help='hostname:port or ip:port of GELF endpoint', default='128.0.0.1:12201')
-        cfg.add_argument('--template', help='the startup script template', default='testnet.template')
-        cfg.add_argument('--max-block-cpu-usage', type=int, help='the "max-block-cpu-usage" value to use in the genesis.json file', default=None)
-        cfg.add_argument('--max-transaction-cpu-usage', type=int, help='the "max-transaction-cpu-usage" value to use in the genesis.json file', default=None)
-        cfg.add_argument('--logging-level', type=fc_log_level, help='Provide the "level" value to use in the logging.json file')
-        cfg.add_argument('--logging-level-map', type=json.loads, help='JSON string of a logging level dictionary to use in the logging.json file for specific nodes, matching based on node number. Ex: {"bios":"off","00":"info"}')
-        cfg.add_argument('--is-nodeos-v2', action='store_true', help='Toggles old nodeos compatibility', default=False)
+        parser = _build_parser()
         r = parser.parse_args(args)
+        # The parser is shared, so give each namespace its own copy of the list defaults
+        for dest in ('down', 'bounce', 'specific_nums', f'specific_{Utils.EosServerName}es', 'spcfc_inst_nums', f'spcfc_inst_{Utils.EosServerName}es'):
+            setattr(r, dest, list(getattr(r, dest)))
         if r.launch != 'none' and r.topology_filename:
             Utils.Print('Output file specified--overriding launch to "none"')
             r.launch = 'none'
-        if r.shape not in ['star', 'mesh', 'ring', 'line'] and not Path(r.shape).is_file():
+        if r.shape not in _BUILTIN_SHAPES and not Path(r.shape).is_file():
             parser.error('-s, --shape must be one of "star", "mesh", "ring", "line", or a file')
         if len(r.specific_nums) != len(getattr(r, f'specific_{Utils.EosServerName}es')):
             parser.error(f'Count of uses of --specific-num and --specific-{Utils.EosServerName} must match')
@@ -230,9 +262,8 @@ class cluster_generator:
             return -100, 'bios', 'node_bios'
         else:
             index = self.next_node
-            indexStr = str(self.next_node)
             self.next_node += 1
-            return index, self.network.name + indexStr.zfill(2), f'node_{indexStr.zfill(2)}'
+            return index, f'{self.network.name}{index:02d}', f'node_{index:02d}'
 
     def define_network(self):
         if self.args.per_host == 0:
@@ -265,7 +296,7 @@ class cluster_generator:
                         lhost.public_name = 'localhost' # servers.nonprod[ondx].name
                         ph_count = 1 # servers.nonprod[ondx].instances
                     else:
-                        lhost.host_name = f'pseudo_{host_ndx.zfil(2)}'
+                        lhost.host_name = f'pseudo_{host_ndx:02d}'
                         lhost.public_name = lhost.host_name
                         ph_count = 1
                     host_ndx += 1
@@ -273,6 +304,7 @@ class cluster_generator:
                 self.aliases.append(lhost.name)
                 do_bios = False
                 ph_count -= 1
+        self.bios_ndx = 0 if self.is_bios_ndx(0) else -1
 
     def bind_nodes(self):
         if self.args.pnodes < 2:
@@ -283,8 +315,10 @@ class cluster_generator:
         i = 0
         producer_number = 0
         to_not_start_node = self.args.total_nodes - self.args.unstarted_nodes - 1
-        accounts = createAccountKeys(len(self.network.nodes.values()))
-        for account, node in zip(accounts, self.network.nodes.values()):
+        shared_producers = self.args.shared_producers
+        nodes = self.network.nodes
+        accounts = createAccountKeys(len(nodes))
+        for account, node in zip(accounts, nodes.values()):
             is_bios = node.name == 'bios'
             if is_bios:
                 node.keys.append(KeyStrings('EOS6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV',
@@ -297,29 +331,19 @@ class cluster_generator:
                     if extra:
                         count += 1
                         extra -= 1
-                    while count > 0:
-                        prodname = producer_name(producer_number)
-                        node.producers.append(prodname)
-                        producer_number += 1
-                        count -= 1
-                    for j in range(0, self.args.shared_producers):
-                        prodname = producer_name(j, True)
-                        node.producers.append(prodname)
+                    node.producers.extend(map(producer_name, range(producer_number, producer_number + count)))
+                    producer_number += count
+                    node.producers.extend(producer_name(j, True) for j in range(shared_producers))
                 node.dont_start = i >= to_not_start_node
             if not is_bios:
                 i += 1
 
     def generate(self):
-        {
-            'ring': self.make_line,
-            'line': lambda: self.make_line(False),
-            'star': self.make_star,
-            'mesh': self.make_mesh,
-        }.get(self.args.shape, self.make_custom)()
+        getattr(self, _SHAPES.get(self.args.shape, 'make_custom'))()
 
         if not self.args.nogen:
-            genesis = self.init_genesis()
-            for node_name, node in self.network.nodes.items():
+            genesis = json.dumps(self.init_genesis(), indent=2)
+            for node in self.network.nodes.values():
                 node.config_dir_name.mkdir(parents=True, exist_ok=True)
                 self.write_logging_config_file(node)
                 self.write_genesis_file(node, genesis)
@@ -335,15 +359,14 @@ class cluster_generator:
         ll = fc_log_level.debug
         if self.args.logging_level:
             ll = self.args.logging_level
-        dex = str(node.index).zfill(2)
+        dex = f'{node.index:02d}'
         if dex in self.args.logging_level_map:
             ll = self.args.logging_level_map[dex]
-        with open(Path(__file__).resolve().parents[0] / 'logging-template.json', 'r') as default:
-            cfg = json.load(default)
+        cfg = json.loads(_logging_template())
         for logger in cfg['loggers']:
             logger['level'] = ll
         with open(node.config_dir_name / 'logging.json', 'w') as out:
-            json.dump(cfg, out, cls=EnhancedEncoder, indent=2)
+            out.write(json.dumps(cfg, cls=EnhancedEncoder, indent=2))
 
     def init_genesis(self):
         genesis_path = self.args.genesis if self.args.genesis.is_absolute() else Path.cwd() / self.args.genesis
@@ -379,34 +402,21 @@ class cluster_generator:
         if self.args.max_transaction_cpu_usage is not None: genesis['initial_configuration']['max_transaction_cpu_usage'] = self.args.max_transaction_cpu_usage
         return genesis
 
-    def write_genesis_file(self, node, genesis):
+    def write_genesis_file(self, node, genesis: str):
         with open(node.config_dir_name / 'genesis.json', 'w') as f:
-            f.write(json.dumps(genesis, indent=2))
+            f.write(genesis)
 
     def is_bios_ndx(self, ndx):
         return self.aliases[ndx] == 'bios'
 
     def start_ndx(self):
-        return 1 if self.is_bios_ndx(0) else 0
+        return 1 if self.bios_ndx == 0 else 0
 
     def next_ndx(self, ndx):
-        ndx += 1
-        loop = ndx == self.args.total_nodes
-        if loop:
-            ndx = self.start_ndx()
-        else:
-            if self.is_bios_ndx(ndx):
-                ndx, loop = self.next_ndx(ndx)
-        return ndx, loop
+        return _next_ndx(ndx, self.args.total_nodes, self.bios_ndx)
 
     def skip_ndx(self, begin, offset):
-        ndx = (begin + offset) % self.args.total_nodes
-        if self.args.total_nodes > 2:
-            attempts = self.args.total_nodes - 1
-            while attempts and (self.is_bios_ndx(ndx) or ndx == begin):
-                ndx, _ = self.next_ndx(ndx)
-                attempts -= 1
-        return ndx
+        return _skip_ndx(begin, offset, self.args.total_nodes, self.bios_ndx)
 
     def make_line(self, make_ring: bool = True):
         if Utils.Debug: Utils.Print(f"making {'ring' if make_ring else 'line'}")
@@ -417,6 +427,12 @@ class cluster_generator:
         if make_ring:
             nl[-1].peers.append(nl[1].name)
 
+    def make_line_ring(self):
+        self.make_line(True)
+
+    def make_line_line(self):
+        self.make_line(False)
+
     def make_star(self):
         if Utils.Debug: Utils.Print('making star')
         non_bios = self.args.total_nodes - 1
@@ -428,47 +444,49 @@ class cluster_generator:
         links = 3
         if non_bios > 12:
             links = int(math.sqrt(non_bios)) + 2
-        gap = 3 if non_bios > 6 else (non_bios - links)/2 + 1
+        gap = 3 if non_bios > 6 else (non_bios - links)//2 + 1
         while non_bios % gap == 0:
             gap += 1
 
+        nodes = self.network.nodes
+        aliases = self.aliases
+        skip = self.skip_ndx
+        nxt = self.next_ndx
         loop = False
         i = self.start_ndx()
         while not loop:
-            current = self.network.nodes[self.aliases[i]]
+            current = nodes[aliases[i]]
+            peers_set = set(current.peers)
             ndx = i
             for l in range(1, links+1):
-                ndx = self.skip_ndx(ndx, l * gap)
-                peer = self.aliases[ndx]
-                found = True
-                while found:
-                    found = False
-                    for p in current.peers:
-                        if p == peer:
-                            ndx, _ = self.next_ndx(ndx)
-                            if ndx == i:
-                                ndx, _ = self.next_ndx(ndx)
-                            peer = self.aliases[ndx]
-                            found = True
-                            break
+                ndx = skip(ndx, l * gap)
+                peer = aliases[ndx]
+                while peer in peers_set:
+                    ndx, _ = nxt(ndx)
+                    if ndx == i:
+                        ndx, _ = nxt(ndx)
+                    peer = aliases[ndx]
                 if peer != current.name:
                     current.peers.append(peer)
-            i, loop = self.next_ndx(i)
+                    peers_set.add(peer)
+            i, loop = nxt(i)
 
     def make_mesh(self):
         if Utils.Debug: Utils.Print('making mesh')
         non_bios = self.args.total_nodes - 1
         self.bind_nodes()
+        nodes = self.network.nodes
+        aliases = self.aliases
+        skip = self.skip_ndx
+        nxt = self.next_ndx
         loop = False
         i = self.start_ndx()
         while not loop:
-            current = self.network.nodes[self.aliases[i]]
-            for j in range(1, non_bios):
-                ndx = self.skip_ndx(i,j)
-                peer = self.aliases[ndx]
-                if peer not in current.peers:
-                    current.peers.append(peer)
-            i, loop = self.next_ndx(i)
+            current = nodes[aliases[i]]
+            peers_set = set(current.peers)
+            candidates = dict.fromkeys([aliases[skip(i, j)] for j in range(1, non_bios)])
+            current.peers.extend([peer for peer in candidates if peer not in peers_set])
+            i, loop = nxt(i)
 
     def make_custom(self):
         if Utils.Debug: Utils.Print('making custom')
@@ -502,14 +520,12 @@ class cluster_generator:
             a(eosdcmd, '--enable-stale-production')
         else:
             a(a(eosdcmd, '--p2p-peer-address'), f'{self.network.nodes["bios"].p2p_endpoint}')
-        peers = list(sum([('--p2p-peer-address', self.network.nodes[p].p2p_endpoint) for p in instance.peers], ()))
-        eosdcmd.extend(peers)
+        nodes = self.network.nodes
+        eosdcmd.extend(arg for p in instance.peers for arg in ('--p2p-peer-address', nodes[p].p2p_endpoint))
         if len(instance.producers) > 0:
             a(a(eosdcmd, '--plugin'), 'eosio::producer_plugin')
-            producer_keys = list(sum([('--signature-provider', f'{key.pubkey}=KEY:{key.privkey}') for key in instance.keys], ()))
-            eosdcmd.extend(producer_keys)
-            producer_names = list(sum([('--producer-name', p) for p in instance.producers], ()))
-            eosdcmd.extend(producer_names)
+            eosdcmd.extend(arg for key in instance.keys for arg in ('--signature-provider', f'{key.pubkey}=KEY:{key.privkey}'))
+            eosdcmd.extend(arg for p in instance.producers for arg in ('--producer-name', p))
         else:
             a(a(eosdcmd, '--transaction-retry-max-storage-size-gb'), '100')
         a(a(eosdcmd, '--plugin'), 'eosio::net_plugin')
@@ -582,13 +598,14 @@ class cluster_generator:
         return eosdcmd
 
     def write_dot_file(self):
-        with open(Utils.DataDir + 'testnet.dot', 'w') as f:
-            f.write('digraph G\n{\nlayout="circo";\n')
-            for node in self.network.nodes.values():
-                for p in node.peers:
-                    pname = self.network.nodes[p].dot_label
-                    f.write(f'"{node.dot_label}"->"{pname}" [dir="forward"];\n')
-            f.write('}')
+        nodes = self.network.nodes
+        lines = ['digraph G\n{\nlayout="circo";\n']
+        for node in nodes.values():
+            label = node.dot_label
+            lines.extend(f'"{label}"->"{nodes[p].dot_label}" [dir="forward"];\n' for p in node.peers)
+        lines.append('}')
+        with open(Utils.DataDir + 'testnet.dot', 'w', buffering=1<<20) as f:
+            f.write(''.join(lines))
         try:
             subprocess.run(['dot', '-Tpng', f'-o{Utils.DataDir}testnet.png', Utils.DataDir + 'testnet.dot'])
         except FileNotFoundError: